@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, List, Optional, Protocol, Tuple
 
 import httpx
 from pydantic import BaseModel
@@ -12,37 +17,63 @@ from dotenv import load_dotenv
 
 from .models import InsightReport, SiteContent, BusinessInsights, MarketingAnalytics, TechnicalAnalytics
 
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # Optional accelerator; fall back to per-term scans
+    ahocorasick = None
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # Optional accelerator; score math stays in Python
+    njit = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # Optional accelerator; fall back to the stdlib encoder
+    orjson = None
+
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProviderResult:
     ok: bool
     text: str
 
 
-class BaseProvider:
-    def available(self) -> bool:
-        raise NotImplementedError
+class BaseProvider(Protocol):
+    def available(self) -> bool: ...
 
-    def generate(self, prompt: str) -> ProviderResult:
-        raise NotImplementedError
+    def generate(self, prompt: str) -> ProviderResult: ...
 
 
-class OpenAIProvider(BaseProvider):
+class OpenAIProvider:
     def __init__(self) -> None:
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self._client = None
 
     def available(self) -> bool:
         return bool(self.api_key)
 
-    def generate(self, prompt: str) -> ProviderResult:
-        try:
+    def _openai(self):
+        # Built on first use and reused so its HTTP connection pool persists
+        if self._client is None:
             from openai import OpenAI  # type: ignore
 
-            client = OpenAI(api_key=self.api_key)
-            resp = client.chat.completions.create(
+            self._client = OpenAI(api_key=self.api_key)
+            # Closed when the provider is collected or at interpreter exit
+            weakref.finalize(self, self._client.close)
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def generate(self, prompt: str) -> ProviderResult:
+        try:
+            resp = self._openai().chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a business analysis assistant. Reply in concise JSON unless asked for prose."},
@@ -56,25 +87,38 @@ class OpenAIProvider(BaseProvider):
             return ProviderResult(False, f"OpenAI error: {e}")
 
 
-class OllamaProvider(BaseProvider):
+class OllamaProvider:
     def __init__(self) -> None:
         self.base = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+        self._client: Optional[httpx.Client] = None
+
+    def _http(self) -> httpx.Client:
+        # One keep-alive pool per provider instead of a new connection per call
+        if self._client is None:
+            self._client = httpx.Client(base_url=self.base, timeout=60.0)
+            # Closed when the provider is collected or at interpreter exit
+            weakref.finalize(self, self._client.close)
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def available(self) -> bool:
         try:
             # Quick health check
-            r = httpx.get(self.base, timeout=1.0)
+            r = self._http().get("/", timeout=1.0)
             return r.status_code < 500
         except Exception:
             return False
 
     def generate(self, prompt: str) -> ProviderResult:
         try:
-            r = httpx.post(
-                f"{self.base}/api/generate",
+            r = self._http().post(
+                "/api/generate",
                 json={"model": self.model, "prompt": prompt, "stream": False, "options": {"temperature": 0.2}},
-                timeout=60.0,
             )
             r.raise_for_status()
             data = r.json()
@@ -83,7 +127,181 @@ class OllamaProvider(BaseProvider):
             return ProviderResult(False, f"Ollama error: {e}")
 
 
-class HeuristicProvider(BaseProvider):
+# Keyword cue scanning
+#
+# Every literal the heuristic helpers look for is assigned one bit. The lowered
+# page text is scanned once and the helpers test the resulting bitmask instead
+# of running their own substring searches.
+
+_CUES: Dict[str, int] = {
+    term: 1 << i
+    for i, term in enumerate((
+        # Industry
+        "clinic", "health", "hospital", "care",
+        "software", "saas", "platform", "api",
+        "shop", "store", "cart", "ecommerce", "e-commerce",
+        "recruit", "staffing", "talent", "hiring",
+        "real estate", "realtor", "property",
+        # Audience
+        "b2b", "enterprise", "businesses", "corporate",
+        "students", "parents", "families", "kids",
+        "developer", "engineer", "it team",
+        # Positioning
+        "premium", "luxury", "exclusive",
+        "affordable", "budget", "cost-effective",
+        "innovative", "cutting-edge", "advanced",
+        # Revenue and pricing
+        "subscription", "monthly", "annual", "consulting", "advisory",
+        "product", "sell", "buy", "training", "course", "workshop",
+        "license", "partnership", "free", "trial", "demo", "custom",
+        "quote", "package", "tier", "pricing", "payment", "billing",
+        # Trust and social proof
+        "award", "certified", "testimonial", "case study", "trusted",
+        "review", "experience", "years", "team", "expert", "customer",
+        "client", "partner",
+        # Acquisition channels
+        "seo", "search", "social", "facebook", "linkedin", "referral",
+        "content", "blog", "news", "email", "newsletter",
+        # Technology and operations
+        "technology", "integration", "mobile", "app", "analytics", "data",
+        "automation", "service", "crm", "digital", "electronic", "ai",
+        "update", "maintenance", "growth", "scale", "fast", "quick",
+        # Security
+        "secure", "ssl", "https", "privacy", "gdpr", "compliance",
+        # Brand and experience
+        "brand", "mission", "professional", "quality", "excellence",
+        "contact", "about", "easy", "simple", "user-friendly",
+    ))
+}
+
+
+def _mask(*terms: str) -> int:
+    bits = 0
+    for term in terms:
+        bits |= _CUES[term]
+    return bits
+
+
+if ahocorasick is not None:
+    _CUE_AUTOMATON = ahocorasick.Automaton()
+    for _term, _bit in _CUES.items():
+        _CUE_AUTOMATON.add_word(_term, _bit)
+    _CUE_AUTOMATON.make_automaton()
+else:
+    _CUE_AUTOMATON = None
+
+
+def _scan_cues(lowered: str) -> int:
+    """Return the bitmask of every cue term occurring in ``lowered``."""
+    flags = 0
+    if _CUE_AUTOMATON is not None:
+        for _, bit in _CUE_AUTOMATON.iter(lowered):
+            flags |= bit
+    else:
+        # Cue terms overlap ("custom"/"customer", "partner"/"partnership"), so
+        # a single regex alternation would miss nested hits; test each term.
+        for term, bit in _CUES.items():
+            if term in lowered:
+                flags |= bit
+    return flags
+
+
+_HEALTH_CUES = _mask("clinic", "health", "hospital", "care")
+_SAAS_CUES = _mask("software", "saas", "platform", "api")
+_ECOMMERCE_CUES = _mask("shop", "store", "cart", "ecommerce", "e-commerce")
+_STAFFING_CUES = _mask("recruit", "staffing", "talent", "hiring")
+_REAL_ESTATE_CUES = _mask("real estate", "realtor", "property")
+_B2B_CUES = _mask("b2b", "enterprise", "businesses", "corporate")
+_FAMILY_CUES = _mask("students", "parents", "families", "kids")
+_DEVELOPER_CUES = _mask("developer", "engineer", "it team")
+
+# Priority-ordered (mask, label) ladders for industry and audience
+_INDUSTRY_RULES: Tuple[Tuple[int, str], ...] = (
+    (_HEALTH_CUES, "Healthcare"),
+    (_SAAS_CUES, "Software / SaaS"),
+    (_ECOMMERCE_CUES, "E-commerce"),
+    (_STAFFING_CUES, "Staffing / Recruiting"),
+    (_REAL_ESTATE_CUES, "Real Estate"),
+)
+_AUDIENCE_RULES: Tuple[Tuple[int, str], ...] = (
+    (_B2B_CUES, "B2B / Enterprises"),
+    (_FAMILY_CUES, "Consumers / Families"),
+    (_DEVELOPER_CUES, "Developers / IT"),
+)
+
+_TRUST_CUES = _mask("award", "certified", "testimonial", "case study", "trusted")
+_BLOG_NEWS_CUES = _mask("blog", "news")
+
+# (category, cue mask, label) rows for the findings that are simply "label if
+# any cue is present". Rows are evaluated in order, so each category's labels
+# keep a stable ordering.
+_RULES: Tuple[Tuple[str, int, str], ...] = (
+    ("revenue", _mask("subscription", "monthly", "annual"), "Subscription/Recurring Revenue"),
+    ("revenue", _mask("consulting", "advisory"), "Professional Services"),
+    ("revenue", _mask("product", "sell", "buy"), "Product Sales"),
+    ("revenue", _mask("training", "course", "workshop"), "Education/Training"),
+    ("revenue", _mask("license", "partnership"), "Licensing/Partnerships"),
+    ("advantages", _TRUST_CUES, "Industry Recognition & Awards"),
+    ("advantages", _mask("experience", "years"), "Established Experience"),
+    ("advantages", _mask("team", "expert"), "Skilled Team & Expertise"),
+    ("advantages", _mask("technology", "platform"), "Advanced Technology Platform"),
+    ("advantages", _mask("customer", "client"), "Strong Customer Relationships"),
+    ("acquisition", _mask("seo", "search"), "Search Engine Optimization"),
+    ("acquisition", _mask("social", "facebook", "linkedin"), "Social Media Marketing"),
+    ("acquisition", _mask("referral", "partner"), "Referral Programs"),
+    ("acquisition", _mask("content", "blog"), "Content Marketing"),
+    ("acquisition", _mask("email", "newsletter"), "Email Marketing"),
+    ("social_proof", _mask("testimonial", "review"), "Customer testimonials"),
+    ("social_proof", _mask("award", "certified"), "Industry awards & certifications"),
+    ("social_proof", _mask("client", "customer"), "Client case studies"),
+    ("social_proof", _mask("partner"), "Strategic partnerships"),
+    ("security", _mask("secure", "ssl", "https"), "SSL/HTTPS security"),
+    ("security", _mask("privacy"), "Privacy policy present"),
+    ("security", _mask("gdpr", "compliance"), "Regulatory compliance mentioned"),
+    ("integration", _mask("crm", "customer"), "CRM system integration"),
+    ("integration", _mask("payment", "billing"), "Payment gateway optimization"),
+    ("integration", _mask("analytics"), "Advanced analytics platform"),
+)
+
+
+def _classify_cues(flags: int) -> DefaultDict[str, List[str]]:
+    """Collect the labels of every matching rule, grouped by category."""
+    findings: DefaultDict[str, List[str]] = defaultdict(list)
+    for category, mask, label in _RULES:
+        if flags & mask:
+            findings[category].append(label)
+    return findings
+
+
+# Words of four or more letters; shorter tokens are never product hints
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z\-']{3,}")
+# "100+", "1000+" or "years" on the raw (case-sensitive) text in one pass
+_SCALE_RE = re.compile(r"10{2,3}\+|years")
+_STOP = frozenset({"about", "services", "solutions", "contact", "learn", "more", "home"})
+
+
+def _freeze(obj: Any) -> Any:
+    """Turn nested dicts/lists into hashable tuples for use in a cache key"""
+    if isinstance(obj, dict):
+        return tuple((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, set):
+        return frozenset(obj)
+    hash(obj)
+    return obj
+
+
+# Below this many non-blank characters a page is treated as having no content.
+# Kept well under a one-sentence business description so typed descriptions
+# still get the full analysis.
+_MIN_TEXT_LEN = 20
+_ANALYSIS_CACHE_SIZE = 256
+_analysis_cache: "OrderedDict[Tuple[bytes, Any], InsightReport]" = OrderedDict()
+_analysis_lock = threading.Lock()
+
+
+class HeuristicProvider:
     def available(self) -> bool:
         # Always available as fallback
         return True
@@ -94,25 +312,39 @@ class HeuristicProvider(BaseProvider):
 
     @staticmethod
     def analyze(text: str, meta: Dict[str, Any]) -> InsightReport:
-        lowered = text.lower()
+        # The heuristic report is a pure function of (text, meta), so repeat
+        # analyses of unchanged content reuse the earlier report. Callers
+        # must treat the returned report as read-only.
+        if len(text.strip()) < _MIN_TEXT_LEN:
+            # Failed scrapes and empty pages: nothing for the cue scan to find
+            return _minimal_report(meta)
+        try:
+            key = (hashlib.blake2b(text.encode(), digest_size=8).digest(), _freeze(meta))
+        except TypeError:
+            # Unhashable metadata values; analyze without caching
+            return HeuristicProvider._analyze(text, meta)
+        with _analysis_lock:
+            report = _analysis_cache.get(key)
+            if report is not None:
+                _analysis_cache.move_to_end(key)
+                return report
+        report = HeuristicProvider._analyze(text, meta)
+        with _analysis_lock:
+            _analysis_cache[key] = report
+            if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+        return report
+
+    @staticmethod
+    def _analyze(text: str, meta: Dict[str, Any]) -> InsightReport:
+        text_len = len(text)
+        flags = _scan_cues(text.lower())
         title = (meta.get("title") or "") if isinstance(meta, dict) else ""
         description = (meta.get("description") or "") if isinstance(meta, dict) else ""
         keywords = (meta.get("keywords") or "") if isinstance(meta, dict) else ""
 
-        # Naive keyword cues
-        industry = None
-        if any(k in lowered for k in ["clinic", "health", "hospital", "care"]):
-            industry = "Healthcare"
-        elif any(k in lowered for k in ["software", "saas", "platform", "api"]):
-            industry = "Software / SaaS"
-        elif any(k in lowered for k in ["shop", "store", "cart", "ecommerce", "e-commerce"]):
-            industry = "E-commerce"
-        elif any(k in lowered for k in ["recruit", "staffing", "talent", "hiring"]):
-            industry = "Staffing / Recruiting"
-        elif any(k in lowered for k in ["real estate", "realtor", "property"]):
-            industry = "Real Estate"
-        else:
-            industry = "General Business"
+        # Naive keyword cues, first matching rule wins
+        industry = next((name for mask, name in _INDUSTRY_RULES if flags & mask), "General Business")
 
         # Extract heading tokens as product hints
         heads = []
@@ -120,81 +352,77 @@ class HeuristicProvider(BaseProvider):
             if isinstance(meta, dict) and isinstance(meta.get(key), list):
                 heads.extend(meta.get(key) or [])
         # Simple splitting
-        tokens = re.findall(r"[A-Za-z][A-Za-z\-']+", " ".join(heads) + " " + title + " " + description + " " + keywords)
-        # Deduplicate, keep meaningful
+        combined = " ".join(heads) + " " + title + " " + description + " " + keywords
+        # Deduplicate, keep meaningful; stop scanning once we have enough
         seen = set()
         key_products: List[str] = []
-        for t in tokens:
-            tt = t.strip().lower()
-            if len(tt) < 4:
-                continue
-            if tt in seen:
+        for m in _TOKEN_RE.finditer(combined):
+            t = m.group()
+            tt = t.lower()
+            if tt in seen or tt in _STOP:
                 continue
             seen.add(tt)
-            if tt not in {"about", "services", "solutions", "contact", "learn", "more", "home"}:
-                key_products.append(t)
+            key_products.append(t)
             if len(key_products) >= 8:
                 break
 
-        target_audience = None
-        if any(k in lowered for k in ["b2b", "enterprise", "businesses", "corporate"]):
-            target_audience = "B2B / Enterprises"
-        elif any(k in lowered for k in ["students", "parents", "families", "kids"]):
-            target_audience = "Consumers / Families"
-        elif any(k in lowered for k in ["developer", "engineer", "it team"]):
-            target_audience = "Developers / IT"
-        else:
-            target_audience = "General Audience"
+        target_audience = next((name for mask, name in _AUDIENCE_RULES if flags & mask), "General Audience")
 
         strengths = []
-        if any(k in lowered for k in ["award", "certified", "testimonial", "case study", "trusted"]):
+        if flags & _TRUST_CUES:
             strengths.append("Trust signals (awards/testimonials)")
-        if len(heads) >= 2:
+        heads_len = len(heads)
+        if heads_len >= 2:
             strengths.append("Clear information hierarchy")
-        if len(text) > 2000:
+        if text_len > 2000:
             strengths.append("Rich content depth")
 
         opportunities = []
-        if "blog" not in lowered and "news" not in lowered:
+        if not flags & _BLOG_NEWS_CUES:
             opportunities.append("Add or improve blog/news content cadence")
         if not keywords:
             opportunities.append("Define meta keywords and semantic coverage")
-        if len(text) < 800:
+        if text_len < 800:
             opportunities.append("Expand on-page copy for SEO")
 
+        findings = _classify_cues(flags)
+        social_proof = findings["social_proof"]
+        if _SCALE_RE.search(text):
+            social_proof.append("Experience & scale metrics")
+
         # Enhanced Business Analytics
         business_insights = BusinessInsights(
-            market_positioning=_analyze_market_positioning(industry, target_audience, text),
-            revenue_streams=_identify_revenue_streams(text, industry),
-            competitive_advantages=_assess_competitive_advantages(text, strengths),
-            risk_factors=_identify_risk_factors(text, industry),
-            digital_maturity_score=_calculate_digital_maturity(text, meta),
-            customer_acquisition_channels=_identify_acquisition_channels(text),
-            pricing_strategy=_analyze_pricing_strategy(text),
-            scalability_assessment=_assess_scalability(text, industry)
+            market_positioning=_analyze_market_positioning(industry, target_audience, flags),
+            revenue_streams=findings["revenue"] or _default_revenue_streams(industry),
+            competitive_advantages=findings["advantages"] or ["Domain Expertise", "Customer Focus"],
+            risk_factors=_identify_risk_factors(text_len, flags, industry),
+            digital_maturity_score=_calculate_digital_maturity(text_len, flags, meta),
+            customer_acquisition_channels=findings["acquisition"] or ["Website Traffic", "Word of Mouth", "Direct Marketing"],
+            pricing_strategy=_analyze_pricing_strategy(flags),
+            scalability_assessment=_assess_scalability(flags, industry)
         )
 
         marketing_analytics = MarketingAnalytics(
-            brand_presence_score=_calculate_brand_presence(text, meta),
-            content_quality_score=_assess_content_quality(text, len(heads)),
-            user_experience_score=_assess_user_experience(text, meta),
-            social_proof_indicators=_find_social_proof(text),
-            conversion_optimization_tips=_generate_conversion_tips(text, industry),
+            brand_presence_score=_calculate_brand_presence(text_len, flags, meta),
+            content_quality_score=_assess_content_quality(text_len, flags, heads_len),
+            user_experience_score=_assess_user_experience(text_len, flags, meta),
+            social_proof_indicators=social_proof,
+            conversion_optimization_tips=_generate_conversion_tips(flags, industry),
             target_demographics=_analyze_demographics(target_audience, text)
         )
 
         technical_analytics = TechnicalAnalytics(
-            website_performance_score=_assess_website_performance(text, meta),
+            website_performance_score=_assess_website_performance(text_len, flags, meta),
             mobile_optimization=_check_mobile_optimization(meta),
-            security_indicators=_assess_security(text),
-            technical_debt_areas=_identify_technical_debt(text),
-            integration_opportunities=_find_integration_opportunities(text, industry)
+            security_indicators=findings["security"] or ["Basic security measures recommended"],
+            technical_debt_areas=_identify_technical_debt(text_len, flags),
+            integration_opportunities=_find_integration_opportunities(findings["integration"], industry)
         )
 
-        strategic_priorities = _generate_strategic_priorities(industry, text)
-        quick_wins = _identify_quick_wins(text, opportunities)
+        strategic_priorities = _generate_strategic_priorities(industry, flags)
+        quick_wins = _identify_quick_wins(flags, opportunities)
         long_term_goals = _set_long_term_goals(industry, target_audience)
-        investment_recommendations = _generate_investment_recommendations(industry, text)
+        investment_recommendations = _generate_investment_recommendations(industry, flags)
 
         overall_score = _calculate_overall_business_score(
             business_insights.digital_maturity_score or 5,
@@ -214,7 +442,7 @@ class HeuristicProvider(BaseProvider):
             raw_findings={"keyword_sample": key_products[:8]},
             report_text=(
                 f"This appears to be a {industry} website targeting {target_audience}. "
-                f"Content length: {len(text)} chars. Overall business score: {overall_score}/100."
+                f"Content length: {text_len} chars. Overall business score: {overall_score}/100."
             ),
             business_insights=business_insights,
             marketing_analytics=marketing_analytics,
@@ -225,78 +453,51 @@ class HeuristicProvider(BaseProvider):
             investment_recommendations=investment_recommendations,
             overall_business_score=overall_score,
             readiness_for_growth=_assess_growth_readiness(overall_score),
-            digital_transformation_needs=_identify_digital_transformation_needs(text, industry)
+            digital_transformation_needs=_identify_digital_transformation_needs(flags, industry)
         )
 
 
 # Enhanced Business Analytics Helper Functions
 
-def _analyze_market_positioning(industry: str, target_audience: str, text: str) -> str:
+def _clamp(value: int, lo: int = 1, hi: int = 10) -> int:
+    """Clamp a score into [lo, hi] without the variadic min/max calls"""
+    return lo if value < lo else hi if value > hi else value
+
+_PREMIUM_CUES = _mask("premium", "luxury", "exclusive")
+_VALUE_CUES = _mask("affordable", "budget", "cost-effective")
+_INNOVATION_CUES = _mask("innovative", "cutting-edge", "advanced")
+
+def _analyze_market_positioning(industry: str, target_audience: str, flags: int) -> str:
     """Analyze market positioning based on industry and content"""
-    lowered = text.lower()
-    if "premium" in lowered or "luxury" in lowered or "exclusive" in lowered:
+    if flags & _PREMIUM_CUES:
         return f"Premium {industry} provider targeting {target_audience}"
-    elif "affordable" in lowered or "budget" in lowered or "cost-effective" in lowered:
+    elif flags & _VALUE_CUES:
         return f"Cost-competitive {industry} solution for {target_audience}"
-    elif "innovative" in lowered or "cutting-edge" in lowered or "advanced" in lowered:
+    elif flags & _INNOVATION_CUES:
         return f"Innovation-focused {industry} leader for {target_audience}"
     else:
         return f"Established {industry} service provider for {target_audience}"
 
-def _identify_revenue_streams(text: str, industry: str) -> List[str]:
-    """Identify potential revenue streams based on content analysis"""
-    lowered = text.lower()
-    streams = []
-    
-    if "subscription" in lowered or "monthly" in lowered or "annual" in lowered:
-        streams.append("Subscription/Recurring Revenue")
-    if "consulting" in lowered or "advisory" in lowered:
-        streams.append("Professional Services")
-    if "product" in lowered or "sell" in lowered or "buy" in lowered:
-        streams.append("Product Sales")
-    if "training" in lowered or "course" in lowered or "workshop" in lowered:
-        streams.append("Education/Training")
-    if "license" in lowered or "partnership" in lowered:
-        streams.append("Licensing/Partnerships")
-    
-    if not streams:
-        if industry == "Software / SaaS":
-            streams = ["SaaS Subscriptions", "Professional Services"]
-        elif industry == "E-commerce":
-            streams = ["Product Sales", "Marketplace Commissions"]
-        elif industry == "Healthcare":
-            streams = ["Service Fees", "Insurance Billing"]
-        else:
-            streams = ["Service Revenue", "Consultancy"]
-    
-    return streams
-
-def _assess_competitive_advantages(text: str, strengths: List[str]) -> List[str]:
-    """Assess competitive advantages from content"""
-    lowered = text.lower()
-    advantages = []
-    
-    if any("award" in s for s in strengths):
-        advantages.append("Industry Recognition & Awards")
-    if "experience" in lowered or "years" in lowered:
-        advantages.append("Established Experience")
-    if "team" in lowered or "expert" in lowered:
-        advantages.append("Skilled Team & Expertise")
-    if "technology" in lowered or "platform" in lowered:
-        advantages.append("Advanced Technology Platform")
-    if "customer" in lowered or "client" in lowered:
-        advantages.append("Strong Customer Relationships")
-    
-    return advantages or ["Domain Expertise", "Customer Focus"]
-
-def _identify_risk_factors(text: str, industry: str) -> List[str]:
+def _default_revenue_streams(industry: str) -> List[str]:
+    """Fallback revenue streams when the content names none"""
+    if industry == "Software / SaaS":
+        return ["SaaS Subscriptions", "Professional Services"]
+    elif industry == "E-commerce":
+        return ["Product Sales", "Marketplace Commissions"]
+    elif industry == "Healthcare":
+        return ["Service Fees", "Insurance Billing"]
+    else:
+        return ["Service Revenue", "Consultancy"]
+
+_CONTACT_CUE = _mask("contact")
+
+def _identify_risk_factors(text_len: int, flags: int, industry: str) -> List[str]:
     """Identify potential business risk factors"""
-    lowered = text.lower()
     risks = []
     
-    if len(text) < 500:
+    if text_len < 500:
         risks.append("Limited online presence")
-    if "contact" not in lowered:
+    if not flags & _CONTACT_CUE:
         risks.append("Unclear contact/communication channels")
     
     # Industry-specific risks
@@ -311,72 +512,65 @@ def _identify_risk_factors(text: str, industry: str) -> List[str]:
     
     return risks
 
-def _calculate_digital_maturity(text: str, meta: Dict[str, Any]) -> int:
+_INTEGRATION_CUES = _mask("api", "integration")
+_MOBILE_CUES = _mask("mobile", "app")
+_DATA_CUES = _mask("analytics", "data")
+
+def _calculate_digital_maturity(text_len: int, flags: int, meta: Dict[str, Any]) -> int:
     """Calculate digital maturity score (1-10)"""
     score = 5  # Base score
-    lowered = text.lower()
     
     # Positive indicators
     if meta.get("og"):
         score += 1  # Social media optimization
-    if "api" in lowered or "integration" in lowered:
+    if flags & _INTEGRATION_CUES:
         score += 1  # Technical sophistication
-    if "mobile" in lowered or "app" in lowered:
+    if flags & _MOBILE_CUES:
         score += 1  # Mobile presence
-    if "analytics" in lowered or "data" in lowered:
+    if flags & _DATA_CUES:
         score += 1  # Data-driven approach
-    if len(text) > 1500:
+    if text_len > 1500:
         score += 1  # Rich digital content
     
-    return min(10, max(1, score))
+    return _clamp(score)
 
-def _identify_acquisition_channels(text: str) -> List[str]:
-    """Identify customer acquisition channels"""
-    lowered = text.lower()
-    channels = []
-    
-    if "seo" in lowered or "search" in lowered:
-        channels.append("Search Engine Optimization")
-    if "social" in lowered or "facebook" in lowered or "linkedin" in lowered:
-        channels.append("Social Media Marketing")
-    if "referral" in lowered or "partner" in lowered:
-        channels.append("Referral Programs")
-    if "content" in lowered or "blog" in lowered:
-        channels.append("Content Marketing")
-    if "email" in lowered or "newsletter" in lowered:
-        channels.append("Email Marketing")
-    
-    return channels or ["Website Traffic", "Word of Mouth", "Direct Marketing"]
+_FREE_CUE = _mask("free")
+_TRIAL_CUES = _mask("trial", "demo")
+_CUSTOM_PRICING_CUES = _mask("custom", "quote")
+_SUBSCRIPTION_CUES = _mask("subscription", "monthly")
+_TIER_CUES = _mask("package", "tier")
 
-def _analyze_pricing_strategy(text: str) -> str:
+def _analyze_pricing_strategy(flags: int) -> str:
     """Analyze pricing strategy from content"""
-    lowered = text.lower()
-    
-    if "free" in lowered and ("trial" in lowered or "demo" in lowered):
+    if flags & _FREE_CUE and flags & _TRIAL_CUES:
         return "Freemium/Trial-based pricing"
-    elif "custom" in lowered or "quote" in lowered:
+    elif flags & _CUSTOM_PRICING_CUES:
         return "Custom/Enterprise pricing"
-    elif "subscription" in lowered or "monthly" in lowered:
+    elif flags & _SUBSCRIPTION_CUES:
         return "Subscription-based pricing"
-    elif "package" in lowered or "tier" in lowered:
+    elif flags & _TIER_CUES:
         return "Tiered pricing packages"
     else:
         return "Value-based pricing strategy"
 
-def _assess_scalability(text: str, industry: str) -> str:
+_SCALABLE_CUES = _mask("automation", "platform", "saas")
+_SERVICE_CUE = _mask("service")
+_PRODUCT_CUE = _mask("product")
+
+def _assess_scalability(flags: int, industry: str) -> str:
     """Assess business scalability potential"""
-    lowered = text.lower()
-    
-    if "automation" in lowered or "platform" in lowered or "saas" in lowered:
+    if flags & _SCALABLE_CUES:
         return "High scalability potential with digital infrastructure"
-    elif "service" in lowered and industry != "Software / SaaS":
+    elif flags & _SERVICE_CUE and industry != "Software / SaaS":
         return "Moderate scalability - service-based model may require scaling teams"
-    elif "product" in lowered:
+    elif flags & _PRODUCT_CUE:
         return "Good scalability potential with product standardization"
     else:
         return "Scalability depends on operational efficiency improvements"
 
-def _calculate_brand_presence(text: str, meta: Dict[str, Any]) -> int:
+_BRAND_CUES = _mask("brand", "mission")
+
+def _calculate_brand_presence(text_len: int, flags: int, meta: Dict[str, Any]) -> int:
     """Calculate brand presence score (1-10)"""
     score = 5
     
@@ -386,74 +580,61 @@ def _calculate_brand_presence(text: str, meta: Dict[str, Any]) -> int:
         score += 1
     if meta.get("og"):
         score += 1
-    if "brand" in text.lower() or "mission" in text.lower():
+    if flags & _BRAND_CUES:
         score += 1
-    if len(text) > 1000:
+    if text_len > 1000:
         score += 1
     
-    return min(10, max(1, score))
+    return _clamp(score)
+
+_QUALITY_CUES = _mask("professional", "expert", "quality", "excellence")
 
-def _assess_content_quality(text: str, heading_count: int) -> int:
+def _assess_content_quality(text_len: int, flags: int, heading_count: int) -> int:
     """Assess content quality score (1-10)"""
     score = 5
     
-    score += min(2, heading_count // 2)  # Good structure
-    score += min(2, len(text) // 1000)   # Content depth
+    score += 2 if heading_count >= 4 else heading_count >> 1  # Good structure
+    score += 2 if text_len >= 2000 else text_len // 1000      # Content depth
     
-    lowered = text.lower()
-    if any(word in lowered for word in ["professional", "expert", "quality", "excellence"]):
+    if flags & _QUALITY_CUES:
         score += 1
     
-    return min(10, max(1, score))
+    return _clamp(score)
 
-def _assess_user_experience(text: str, meta: Dict[str, Any]) -> int:
+_ABOUT_CUE = _mask("about")
+_EASE_CUES = _mask("easy", "simple", "user-friendly")
+
+def _assess_user_experience(text_len: int, flags: int, meta: Dict[str, Any]) -> int:
     """Assess user experience score (1-10)"""
     score = 5
-    lowered = text.lower()
     
-    if "contact" in lowered:
+    if flags & _CONTACT_CUE:
         score += 1
-    if "about" in lowered:
+    if flags & _ABOUT_CUE:
         score += 1
     if meta.get("description"):
         score += 1
-    if len(text) > 800:
+    if text_len > 800:
         score += 1
-    if "easy" in lowered or "simple" in lowered or "user-friendly" in lowered:
+    if flags & _EASE_CUES:
         score += 1
     
-    return min(10, max(1, score))
+    return _clamp(score)
 
-def _find_social_proof(text: str) -> List[str]:
-    """Find social proof indicators"""
-    lowered = text.lower()
-    proof = []
-    
-    if "testimonial" in lowered or "review" in lowered:
-        proof.append("Customer testimonials")
-    if "award" in lowered or "certified" in lowered:
-        proof.append("Industry awards & certifications")
-    if "client" in lowered or "customer" in lowered:
-        proof.append("Client case studies")
-    if "partner" in lowered:
-        proof.append("Strategic partnerships")
-    if any(num in text for num in ["100+", "1000+", "years"]):
-        proof.append("Experience & scale metrics")
-    
-    return proof
+_TESTIMONIAL_CUE = _mask("testimonial")
+_PRICING_CUES = _mask("pricing", "quote")
 
-def _generate_conversion_tips(text: str, industry: str) -> List[str]:
+def _generate_conversion_tips(flags: int, industry: str) -> List[str]:
     """Generate conversion optimization tips"""
-    lowered = text.lower()
     tips = []
     
-    if "contact" not in lowered:
+    if not flags & _CONTACT_CUE:
         tips.append("Add clear contact/CTA buttons")
-    if "testimonial" not in lowered:
+    if not flags & _TESTIMONIAL_CUE:
         tips.append("Include customer testimonials")
-    if "pricing" not in lowered and "quote" not in lowered:
+    if not flags & _PRICING_CUES:
         tips.append("Display pricing or offer quotes")
-    if "about" not in lowered:
+    if not flags & _ABOUT_CUE:
         tips.append("Add compelling about section")
     
     # Industry-specific tips
@@ -475,7 +656,9 @@ def _analyze_demographics(target_audience: str, text: str) -> str:
     else:
         return "Broad consumer market, age 25-55, tech-savvy users"
 
-def _assess_website_performance(text: str, meta: Dict[str, Any]) -> int:
+_SPEED_CUES = _mask("fast", "quick")
+
+def _assess_website_performance(text_len: int, flags: int, meta: Dict[str, Any]) -> int:
     """Assess website performance indicators (1-10)"""
     score = 5
     
@@ -485,12 +668,12 @@ def _assess_website_performance(text: str, meta: Dict[str, Any]) -> int:
         score += 1
     if meta.get("og"):
         score += 1
-    if len(text) > 500:
+    if text_len > 500:
         score += 1
-    if "fast" in text.lower() or "quick" in text.lower():
+    if flags & _SPEED_CUES:
         score += 1
     
-    return min(10, max(1, score))
+    return _clamp(score)
 
 def _check_mobile_optimization(meta: Dict[str, Any]) -> str:
     """Check mobile optimization status"""
@@ -500,44 +683,21 @@ def _check_mobile_optimization(meta: Dict[str, Any]) -> str:
     else:
         return "Mobile optimization needs verification"
 
-def _assess_security(text: str) -> List[str]:
-    """Assess security indicators"""
-    lowered = text.lower()
-    indicators = []
-    
-    if "secure" in lowered or "ssl" in lowered or "https" in lowered:
-        indicators.append("SSL/HTTPS security")
-    if "privacy" in lowered:
-        indicators.append("Privacy policy present")
-    if "gdpr" in lowered or "compliance" in lowered:
-        indicators.append("Regulatory compliance mentioned")
-    
-    return indicators or ["Basic security measures recommended"]
+_MAINTENANCE_CUES = _mask("update", "maintenance")
 
-def _identify_technical_debt(text: str) -> List[str]:
+def _identify_technical_debt(text_len: int, flags: int) -> List[str]:
     """Identify potential technical debt areas"""
-    lowered = text.lower()
     debt_areas = []
     
-    if len(text) < 300:
+    if text_len < 300:
         debt_areas.append("Limited content depth")
-    if "update" in lowered or "maintenance" in lowered:
+    if flags & _MAINTENANCE_CUES:
         debt_areas.append("Regular content updates needed")
     
     return debt_areas or ["Regular maintenance and updates recommended"]
 
-def _find_integration_opportunities(text: str, industry: str) -> List[str]:
-    """Find integration opportunities"""
-    lowered = text.lower()
-    opportunities = []
-    
-    if "crm" in lowered or "customer" in lowered:
-        opportunities.append("CRM system integration")
-    if "payment" in lowered or "billing" in lowered:
-        opportunities.append("Payment gateway optimization")
-    if "analytics" in lowered:
-        opportunities.append("Advanced analytics platform")
-    
+def _find_integration_opportunities(opportunities: List[str], industry: str) -> List[str]:
+    """Add industry-specific integrations to the cue-matched ones"""
     # Industry-specific
     if industry == "E-commerce":
         opportunities.append("Inventory management system")
@@ -546,14 +706,16 @@ def _find_integration_opportunities(text: str, industry: str) -> List[str]:
     
     return opportunities or ["Third-party tool integrations", "Automation platforms"]
 
-def _generate_strategic_priorities(industry: str, text: str) -> List[str]:
+_CUSTOMER_CUE = _mask("customer")
+_GROWTH_CUES = _mask("growth", "scale")
+
+def _generate_strategic_priorities(industry: str, flags: int) -> List[str]:
     """Generate strategic priorities"""
     priorities = []
-    lowered = text.lower()
     
-    if "customer" in lowered:
+    if flags & _CUSTOMER_CUE:
         priorities.append("Enhance customer experience")
-    if "growth" in lowered or "scale" in lowered:
+    if flags & _GROWTH_CUES:
         priorities.append("Scale operations efficiently")
     
     # Industry-specific priorities
@@ -568,7 +730,7 @@ def _generate_strategic_priorities(industry: str, text: str) -> List[str]:
     
     return priorities
 
-def _identify_quick_wins(text: str, opportunities: List[str]) -> List[str]:
+def _identify_quick_wins(flags: int, opportunities: List[str]) -> List[str]:
     """Identify quick wins"""
     quick_wins = []
     
@@ -580,7 +742,7 @@ def _identify_quick_wins(text: str, opportunities: List[str]) -> List[str]:
             quick_wins.append("Expand content marketing")
     
     # Additional quick wins
-    if "contact" not in text.lower():
+    if not flags & _CONTACT_CUE:
         quick_wins.append("Add clear contact information")
     
     return quick_wins or ["Optimize website conversion", "Enhance online presence"]
@@ -601,14 +763,16 @@ def _set_long_term_goals(industry: str, target_audience: str) -> List[str]:
     
     return goals
 
-def _generate_investment_recommendations(industry: str, text: str) -> List[str]:
+_INFRASTRUCTURE_CUES = _mask("technology", "digital")
+_HIRING_CUES = _mask("team", "hiring")
+
+def _generate_investment_recommendations(industry: str, flags: int) -> List[str]:
     """Generate investment recommendations"""
     recommendations = []
-    lowered = text.lower()
     
-    if "technology" in lowered or "digital" in lowered:
+    if flags & _INFRASTRUCTURE_CUES:
         recommendations.append("Technology infrastructure upgrade")
-    if "team" in lowered or "hiring" in lowered:
+    if flags & _HIRING_CUES:
         recommendations.append("Human capital investment")
     
     # Industry-specific
@@ -621,10 +785,20 @@ def _generate_investment_recommendations(industry: str, text: str) -> List[str]:
     
     return recommendations
 
+def _overall_score_core(digital_score: int, brand_score: int, tech_score: int) -> int:
+    # Integer-only so it compiles in Numba's nopython mode; * 5 // 4 equals
+    # int(x * 1.25) for the non-negative weighted sums seen here
+    weighted_score = (digital_score * 3 + brand_score * 3 + tech_score * 2) * 5 // 4
+    return 1 if weighted_score < 1 else 100 if weighted_score > 100 else weighted_score
+
+
+if njit is not None:
+    _overall_score_core = njit(cache=True)(_overall_score_core)
+
+
 def _calculate_overall_business_score(digital_score: int, brand_score: int, tech_score: int) -> int:
     """Calculate overall business score (1-100)"""
-    weighted_score = (digital_score * 3 + brand_score * 3 + tech_score * 2) * 1.25
-    return min(100, max(1, int(weighted_score)))
+    return int(_overall_score_core(digital_score, brand_score, tech_score))
 
 def _assess_growth_readiness(score: int) -> str:
     """Assess growth readiness based on overall score"""
@@ -637,34 +811,90 @@ def _assess_growth_readiness(score: int) -> str:
     else:
         return "Low - Requires significant development"
 
-def _identify_digital_transformation_needs(text: str, industry: str) -> List[str]:
+_DIGITAL_CUE = _mask("digital")
+_AUTOMATION_CUE = _mask("automation")
+_ELECTRONIC_CUE = _mask("electronic")
+_AI_CUE = _mask("ai")
+
+def _identify_digital_transformation_needs(flags: int, industry: str) -> List[str]:
     """Identify digital transformation needs"""
-    lowered = text.lower()
     needs = []
     
-    if "digital" not in lowered:
+    if not flags & _DIGITAL_CUE:
         needs.append("Digital strategy development")
-    if "automation" not in lowered:
+    if not flags & _AUTOMATION_CUE:
         needs.append("Process automation")
-    if "data" not in lowered and "analytics" not in lowered:
+    if not flags & _DATA_CUES:
         needs.append("Data analytics implementation")
     
     # Industry-specific needs
-    if industry == "Healthcare" and "electronic" not in lowered:
+    if industry == "Healthcare" and not flags & _ELECTRONIC_CUE:
         needs.append("Electronic health records")
-    elif industry == "E-commerce" and "ai" not in lowered:
+    elif industry == "E-commerce" and not flags & _AI_CUE:
         needs.append("AI-powered recommendations")
     
     return needs or ["Cloud migration", "Digital workflow optimization"]
 
 
-def select_provider() -> BaseProvider:
-    for p in (OpenAIProvider(), OllamaProvider()):
-        if p.available():
-            return p
+def _minimal_report(meta: Dict[str, Any]) -> InsightReport:
+    """Report for pages with no usable content"""
+    title = (meta.get("title") or "") if isinstance(meta, dict) else ""
+    description = (meta.get("description") or "") if isinstance(meta, dict) else ""
+    overall_score = 20
+    return InsightReport(
+        industry="General Business",
+        target_audience="General Audience",
+        growth_opportunities=["Expand on-page copy for SEO"],
+        seo_summary=(f"Title: {title[:80]} | Description: {description[:160]}") if (title or description) else None,
+        report_text=(
+            "Too little website content was available for a detailed analysis. "
+            f"Overall business score: {overall_score}/100."
+        ),
+        business_insights=BusinessInsights(risk_factors=["Limited online presence"]),
+        quick_wins=["Add clear contact information", "Enhance online presence"],
+        overall_business_score=overall_score,
+        readiness_for_growth=_assess_growth_readiness(overall_score),
+        digital_transformation_needs=["Digital strategy development"],
+    )
+
+
+# Provider probing costs an HTTP round trip to Ollama, so the choice is reused
+# for a short window instead of being re-probed on every analysis.
+_PROVIDER_TTL_SEC = 30.0
+_provider_cache: Optional[Tuple[BaseProvider, float]] = None
+
+
+_provider_lock = threading.Lock()
+
+
+def _discover_provider() -> BaseProvider:
+    # Priority order. The OpenAI check only looks at the API key, so key users
+    # never pay for the Ollama HTTP probe.
+    openai = OpenAIProvider()
+    if openai.available():
+        return openai
+    ollama = OllamaProvider()
+    if ollama.available():
+        return ollama
     return HeuristicProvider()
 
 
+def select_provider() -> BaseProvider:
+    global _provider_cache
+    cached = _provider_cache
+    if cached is not None and time.monotonic() - cached[1] < _PROVIDER_TTL_SEC:
+        return cached[0]
+    # Single-flight: when the cache expires, one caller re-probes and the
+    # others wait for its answer instead of each probing Ollama themselves
+    with _provider_lock:
+        cached = _provider_cache
+        if cached is not None and time.monotonic() - cached[1] < _PROVIDER_TTL_SEC:
+            return cached[0]
+        provider = _discover_provider()
+        _provider_cache = (provider, time.monotonic())
+        return provider
+
+
 JSON_SCHEMA_HINT = {
     "industry": "string",
     "key_products": ["string"],
@@ -679,35 +909,93 @@ JSON_SCHEMA_HINT = {
 }
 
 
+_HEADING_KEYS = frozenset({"h1", "h2"})
+
+
+def _dump_capped(obj: Any, limit: int = 4000) -> str:
+    """Serialize obj to JSON, stopping once limit characters have been produced"""
+    if isinstance(obj, dict):
+        # Heading lists can hold hundreds of entries that would be cut anyway
+        obj = {k: (v[:20] if k in _HEADING_KEYS and isinstance(v, list) else v) for k, v in obj.items()}
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()[:limit]
+        except TypeError:
+            pass
+    parts: List[str] = []
+    size = 0
+    for chunk in json.JSONEncoder().iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+_PROMPT_TEMPLATE = (
+    "Analyze the following website content and metadata. "
+    "Return a concise JSON object with keys: industry, key_products (array), "
+    "target_audience, website_strength, growth_opportunities (array), competitors (array), "
+    "seo_summary, sentiment_summary, raw_findings (object), report_text.\n\n"
+    "Metadata: {meta}\n\n"
+    "Content (truncated): {text}\n\n"
+    "Respond ONLY with valid JSON, no code fences."
+)
+
+
 def _build_prompt(text: str, meta: Dict[str, Any]) -> str:
-    return (
-        "Analyze the following website content and metadata. "
-        "Return a concise JSON object with keys: industry, key_products (array), "
-        "target_audience, website_strength, growth_opportunities (array), competitors (array), "
-        "seo_summary, sentiment_summary, raw_findings (object), report_text.\n\n"
-        f"Metadata: {json.dumps(meta)[:4000]}\n\n"
-        f"Content (truncated): {text[:8000]}\n\n"
-        "Respond ONLY with valid JSON, no code fences."
-    )
+    return _PROMPT_TEMPLATE.format(meta=_dump_capped(meta), text=text[:8000])
+
+
+def _extract_json(s: str) -> Optional[str]:
+    """Return the first balanced {...} span, ignoring braces inside JSON strings"""
+    start = s.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_str = False
+    esc = False
+    for j in range(start, len(s)):
+        c = s[j]
+        if in_str:
+            if esc:
+                esc = False
+            elif c == "\\":
+                esc = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start:j + 1]
+    # Unbalanced (e.g. truncated output)
+    return None
+
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 
 def _parse_json_maybe(s: str) -> Optional[Dict[str, Any]]:
-    s = s.strip()
-    # Remove code fences if present
-    s = re.sub(r"^```(?:json)?|```$", "", s, flags=re.IGNORECASE | re.MULTILINE)
-    # Extract first JSON object
-    m = re.search(r"\{[\s\S]*\}", s)
-    if not m:
+    # Extract first JSON object; code fences and surrounding prose fall outside it
+    candidate = _extract_json(s)
+    if candidate is None:
         return None
     try:
-        return json.loads(m.group(0))
+        return _loads(candidate)
     except Exception:
         return None
 
 
-def analyze_text(text: str, meta: Optional[Dict[str, Any]] = None) -> InsightReport:
+def analyze_text(
+    text: str, meta: Optional[Dict[str, Any]] = None, provider: Optional[BaseProvider] = None
+) -> InsightReport:
     meta = meta or {}
-    provider = select_provider()
+    if provider is None:
+        provider = select_provider()
 
     if isinstance(provider, HeuristicProvider):
         return provider.analyze(text, meta)
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from fastapi import FastAPI, Request, Form, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 import time
+import uuid
 
-from .analyzer import analyze_site, analyze_text
+from dotenv import load_dotenv
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+# The analyzer stack (LLM clients, numba, bs4) is imported on first use in
+# _run_analysis so boot and /health stay light. It used to load .env as a
+# side effect of that import; the settings below need it up front.
+load_dotenv()
+
+try:
+    import redis.asyncio as aioredis  # type: ignore
+except ImportError:
+    aioredis = None
 
 # App configuration
 app = FastAPI(
@@ -36,45 +49,123 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Rate limiting simple implementation
-request_times = {}
+# Rate limiting simple implementation: a token bucket per IP holding up to
+# RATE_LIMIT tokens, refilled continuously over RATE_WINDOW_SEC. Buckets live in
+# an OrderedDict capped at RATE_MAX_CLIENTS so idle IPs are evicted.
+RATE_LIMIT = 10
+RATE_WINDOW_SEC = 60.0
+RATE_MAX_CLIENTS = 10_000
+request_times: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+def _local_rate_limit(client_ip: str) -> bool:
+    now = time.monotonic()
+
+    tokens, last = request_times.pop(client_ip, (float(RATE_LIMIT), now))
+    tokens = min(RATE_LIMIT, tokens + (now - last) * (RATE_LIMIT / RATE_WINDOW_SEC))
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+
+    # Re-inserting moves the IP to the most-recent end
+    request_times[client_ip] = (tokens, now)
+    if len(request_times) > RATE_MAX_CLIENTS:
+        request_times.popitem(last=False)
+    return allowed
+
+
+# With several workers or replicas the in-process buckets each allow the full
+# rate, so when REDIS_URL is set the limit is shared through Redis instead: a
+# rolling window kept in a sorted set per IP, trimmed/counted/added atomically.
+_RATE_LIMIT_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, window)
+return 1
+"""
+
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client = aioredis.from_url(REDIS_URL) if (aioredis and REDIS_URL) else None
+_rate_limit_script = (
+    redis_client.register_script(_RATE_LIMIT_LUA) if redis_client else None
+)
 
-def simple_rate_limit(request: Request) -> bool:
+
+async def simple_rate_limit(request: Request) -> bool:
     """Simple rate limiting: max 10 requests per minute per IP"""
     client_ip = request.client.host
-    current_time = time.time()
-    
-    if client_ip not in request_times:
-        request_times[client_ip] = []
-    
-    # Clean old requests (older than 1 minute)
-    request_times[client_ip] = [t for t in request_times[client_ip] if current_time - t < 60]
-    
-    # Check if limit exceeded
-    if len(request_times[client_ip]) >= 10:
-        return False
-    
-    # Add current request
-    request_times[client_ip].append(current_time)
-    return True
+    if _rate_limit_script is not None:
+        try:
+            allowed = await _rate_limit_script(
+                keys=[f"rl:{client_ip}"],
+                args=[
+                    int(time.time() * 1000),
+                    int(RATE_WINDOW_SEC * 1000),
+                    RATE_LIMIT,
+                    uuid.uuid4().hex,
+                ],
+            )
+            return bool(allowed)
+        except Exception:
+            # Redis unavailable: degrade to the per-process limiter
+            pass
+    return _local_rate_limit(client_ip)
 
 base_dir = os.path.dirname(__file__)
 static_dir = os.path.join(base_dir, "static")
-templates = Jinja2Templates(directory=os.path.join(base_dir, "templates"))
+
+# One Jinja environment for the app's lifetime. Templates are compiled once and
+# kept in memory; the bytecode cache lets new workers skip compilation too.
+# DEBUG re-enables auto_reload for template editing.
+# Jinja's default cache directory is per-user, mode 0700 and ownership-checked,
+# so other local users cannot plant compiled templates in it.
+try:
+    _bytecode_cache = FileSystemBytecodeCache()
+except (OSError, RuntimeError):
+    _bytecode_cache = None
+
+jinja_env = Environment(
+    loader=FileSystemLoader(os.path.join(base_dir, "templates")),
+    autoescape=True,
+    auto_reload=os.getenv("DEBUG", "False").lower() == "true",
+    cache_size=-1,
+    bytecode_cache=_bytecode_cache,
+)
+for _name in ("index.html", "about.html"):
+    jinja_env.get_template(_name)
+
+
+def render(name: str, context: dict) -> HTMLResponse:
+    return HTMLResponse(jinja_env.get_template(name).render(context))
+
+
+def _run_analysis(url: str, description: str):
+    # Runs in the threadpool, so the one-off heavy import never blocks the loop
+    from .analyzer import analyze_site, analyze_text
+
+    if url:
+        return analyze_site(url)
+    return analyze_text(description, meta={})
+
 
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request, "result": None, "error": None})
+    return render("index.html", {"request": request, "result": None, "error": None})
 
 
 @app.post("/analyze", response_class=HTMLResponse)
 async def analyze(request: Request, url: Optional[str] = Form(default=""), description: Optional[str] = Form(default="")):
     # Rate limiting
-    if not simple_rate_limit(request):
-        return templates.TemplateResponse(
+    if not await simple_rate_limit(request):
+        return render(
             "index.html", 
             {"request": request, "result": None, "error": "Rate limit exceeded. Please wait a minute before trying again."}
         )
@@ -83,7 +174,7 @@ async def analyze(request: Request, url: Optional[str] = Form(default=""), descr
     description = (description or "").strip()
 
     if not url and not description:
-        return templates.TemplateResponse(
+        return render(
             "index.html", {"request": request, "result": None, "error": "Please provide a URL or a description."}
         )
 
@@ -92,22 +183,21 @@ async def analyze(request: Request, url: Optional[str] = Form(default=""), descr
             # Validate URL format
             if not (url.startswith("http://") or url.startswith("https://") or url.startswith("www.")):
                 url = "https://" + url
-            result = analyze_site(url)
-        else:
-            result = analyze_text(description, meta={})
-
-        return templates.TemplateResponse("index.html", {"request": request, "result": result, "error": None})
+        # Scraping and analysis block; keep them off the event loop
+        result = await run_in_threadpool(_run_analysis, url, description)
+
+        return render("index.html", {"request": request, "result": result, "error": None})
+    except TimeoutError:
+        error_message = "Analysis timed out. Please try again with a simpler request."
+    except ConnectionError:
+        error_message = "Unable to connect to the website. Please check the URL and try again."
     except Exception as e:
         error_message = f"Failed to analyze: {str(e)}"
-        if "timeout" in str(e).lower():
-            error_message = "Analysis timed out. Please try again with a simpler request."
-        elif "connection" in str(e).lower():
-            error_message = "Unable to connect to the website. Please check the URL and try again."
-        
-        return templates.TemplateResponse(
-            "index.html",
-            {"request": request, "result": None, "error": error_message},
-        )
+
+    return render(
+        "index.html",
+        {"request": request, "result": None, "error": error_message},
+    )
 
 
 # Health endpoint for monitoring
@@ -125,4 +215,4 @@ async def api_health():
 # About page
 @app.get("/about", response_class=HTMLResponse)
 async def about(request: Request):
-    return templates.TemplateResponse("about.html", {"request": request})
+    return render("about.html", {"request": request})
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
 
 
 class AnalysisRequest(BaseModel):
@@ -10,20 +10,23 @@ class AnalysisRequest(BaseModel):
 
 
 class SiteContent(BaseModel):
+    # Shared between callers through the scrape cache, so never mutated
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     url: Optional[str]
     text: str
     meta: Dict[str, Any]
-    links: List[str] = []
+    links: List[str] = Field(default_factory=list)
 
 
 class BusinessInsights(BaseModel):
     """Comprehensive business analytics and insights"""
     market_positioning: Optional[str] = None
-    revenue_streams: List[str] = []
-    competitive_advantages: List[str] = []
-    risk_factors: List[str] = []
+    revenue_streams: List[str] = Field(default_factory=list)
+    competitive_advantages: List[str] = Field(default_factory=list)
+    risk_factors: List[str] = Field(default_factory=list)
     digital_maturity_score: Optional[int] = Field(default=None, ge=1, le=10)
-    customer_acquisition_channels: List[str] = []
+    customer_acquisition_channels: List[str] = Field(default_factory=list)
     pricing_strategy: Optional[str] = None
     scalability_assessment: Optional[str] = None
 
@@ -33,8 +36,8 @@ class MarketingAnalytics(BaseModel):
     brand_presence_score: Optional[int] = Field(default=None, ge=1, le=10)
     content_quality_score: Optional[int] = Field(default=None, ge=1, le=10)
     user_experience_score: Optional[int] = Field(default=None, ge=1, le=10)
-    social_proof_indicators: List[str] = []
-    conversion_optimization_tips: List[str] = []
+    social_proof_indicators: List[str] = Field(default_factory=list)
+    conversion_optimization_tips: List[str] = Field(default_factory=list)
     target_demographics: Optional[str] = None
 
 
@@ -42,22 +45,22 @@ class TechnicalAnalytics(BaseModel):
     """Technical and digital performance insights"""
     website_performance_score: Optional[int] = Field(default=None, ge=1, le=10)
     mobile_optimization: Optional[str] = None
-    security_indicators: List[str] = []
-    technical_debt_areas: List[str] = []
-    integration_opportunities: List[str] = []
+    security_indicators: List[str] = Field(default_factory=list)
+    technical_debt_areas: List[str] = Field(default_factory=list)
+    integration_opportunities: List[str] = Field(default_factory=list)
 
 
 class InsightReport(BaseModel):
     # Original fields
     industry: Optional[str] = None
-    key_products: List[str] = []
+    key_products: List[str] = Field(default_factory=list)
     target_audience: Optional[str] = None
     website_strength: Optional[str] = None
-    growth_opportunities: List[str] = []
-    competitors: List[str] = []
+    growth_opportunities: List[str] = Field(default_factory=list)
+    competitors: List[str] = Field(default_factory=list)
     seo_summary: Optional[str] = None
     sentiment_summary: Optional[str] = None
-    raw_findings: Dict[str, object] = {}
+    raw_findings: Dict[str, object] = Field(default_factory=dict)
     report_text: Optional[str] = None
     
     # Enhanced business analytics
@@ -66,15 +69,15 @@ class InsightReport(BaseModel):
     technical_analytics: Optional[TechnicalAnalytics] = None
     
     # Strategic recommendations
-    strategic_priorities: List[str] = []
-    quick_wins: List[str] = []
-    long_term_goals: List[str] = []
-    investment_recommendations: List[str] = []
+    strategic_priorities: List[str] = Field(default_factory=list)
+    quick_wins: List[str] = Field(default_factory=list)
+    long_term_goals: List[str] = Field(default_factory=list)
+    investment_recommendations: List[str] = Field(default_factory=list)
     
     # Performance metrics
     overall_business_score: Optional[int] = Field(default=None, ge=1, le=100)
     readiness_for_growth: Optional[str] = None
-    digital_transformation_needs: List[str] = []
+    digital_transformation_needs: List[str] = Field(default_factory=list)
 
 
 __all__ = [
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import re
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from urllib import robotparser
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
 from bs4 import BeautifulSoup, NavigableString, Comment
 
 from .models import SiteContent
 
+try:
+    import lxml  # type: ignore  # noqa: F401
+
+    # C tokenizer; several times faster than the pure-Python html.parser
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+try:
+    # lexbor-backed parser; much faster than any BeautifulSoup tree builder
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+except ImportError:
+    LexborHTMLParser = None
+
 
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -19,24 +40,79 @@ DEFAULT_HEADERS = {
     )
 }
 
-_ROBOTS_CACHE: Dict[str, robotparser.RobotFileParser] = {}
 _USER_AGENT = DEFAULT_HEADERS["User-Agent"]
 
+# One pooled session so repeat fetches (robots.txt, sub-pages) reuse sockets.
+# Its default Accept-Encoding already offers br whenever brotli is installed,
+# and urllib3 decodes it, so the header is not overridden here.
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+_adapter = HTTPAdapter(pool_connections=100, pool_maxsize=100)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+class _TTLCache:
+    """Thread-safe LRU mapping whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[1] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return item[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+_PER_HOST_CONCURRENCY = 2
+# Pages beyond this are truncated; the analyzer only needs the first part
+_MAX_BYTES = 2_000_000
+# Parsed robots.txt per netloc; bounded so many distinct hosts can't leak memory
+_ROBOTS_CACHE = _TTLCache(maxsize=1024, ttl=3600.0)
+# Parsed sites, keyed by (url, max_pages); repeat analyses skip fetch + parse
+_SITE_CACHE = _TTLCache(maxsize=512, ttl=600.0)
+
 
 def _get_robot_parser(base_url: str) -> robotparser.RobotFileParser:
     """Retrieve and cache robots.txt parser for a given site."""
-    netloc = urlparse(base_url).netloc
-    if netloc in _ROBOTS_CACHE:
-        return _ROBOTS_CACHE[netloc]
+    parsed = urlparse(base_url)
+    netloc = parsed.netloc
+    cached = _ROBOTS_CACHE.get(netloc)
+    if cached is not None:
+        return cached
     rp = robotparser.RobotFileParser()
-    robots_url = f"{urlparse(base_url).scheme}://{netloc}/robots.txt"
+    robots_url = f"{parsed.scheme}://{netloc}/robots.txt"
+    rp.set_url(robots_url)
     try:
-        rp.set_url(robots_url)
-        rp.read()
-    except Exception:
-        # If robots cannot be fetched, default to allowing minimal fetch
-        pass
-    _ROBOTS_CACHE[netloc] = rp
+        resp = SESSION.get(robots_url, timeout=5)
+        # Same status handling as RobotFileParser.read()
+        if resp.status_code in (401, 403):
+            rp.disallow_all = True
+        elif 400 <= resp.status_code < 500:
+            rp.allow_all = True
+        elif resp.status_code < 400:
+            rp.parse(resp.text.splitlines())
+    except requests.RequestException:
+        # If robots cannot be fetched, default to allowing minimal fetch. The
+        # failure is cached too so an unreachable host is not retried per page.
+        rp.allow_all = True
+    _ROBOTS_CACHE.set(netloc, rp)
     return rp
 
 
@@ -49,29 +125,57 @@ def _allowed_by_robots(url: str) -> bool:
         return True
 
 
+_SCHEME_RE = re.compile(r"^https?://")
+
+
 def normalize_url(url: str) -> str:
-    if not re.match(r"^https?://", url):
+    if not _SCHEME_RE.match(url):
         url = "http://" + url.strip()
     return url
 
 
 def fetch_url(url: str, timeout: int = 15) -> Optional[str]:
+    """Return the page HTML, or None if it is disallowed or not usable HTML.
+
+    Raises TimeoutError / ConnectionError when the host does not answer, so
+    callers can tell an unreachable site apart from an empty page.
+    """
     # Caller should check robots, but double-check here defensively
     if not _allowed_by_robots(url):
         return None
     try:
-        resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
-        if resp.status_code == 200 and resp.content:
-            # Prefer response.apparent_encoding if available
-            resp.encoding = resp.apparent_encoding or resp.encoding
-            return resp.text
-    except requests.RequestException:
+        with SESSION.get(url, timeout=timeout, stream=True) as resp:
+            if resp.status_code != 200:
+                return None
+            ctype = resp.headers.get("Content-Type", "").lower()
+            # Skip PDFs, images, etc. without downloading them
+            if ctype and "html" not in ctype:
+                return None
+            body = resp.raw.read(_MAX_BYTES, decode_content=True)
+    except (requests.Timeout, urllib3.exceptions.TimeoutError) as e:
+        raise TimeoutError(f"Timed out fetching {url}") from e
+    except requests.ConnectionError as e:
+        raise ConnectionError(f"Could not connect to {url}") from e
+    except (requests.RequestException, urllib3.exceptions.HTTPError):
+        return None
+    if not body:
         return None
-    return None
+    # Only sniff the encoding when the server did not declare a charset
+    encoding = resp.encoding if "charset=" in ctype else None
+    if not encoding:
+        encoding = chardet.detect(body)["encoding"] or "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+_WS_RE = re.compile(r"\s+")
+_HIDDEN_PARENTS = frozenset({"style", "script", "head", "title", "meta", "noscript"})
 
 
 def _visible_text(element) -> bool:
-    if element.parent.name in ["style", "script", "head", "title", "meta", "noscript"]:
+    if element.parent.name in _HIDDEN_PARENTS:
         return False
     if isinstance(element, Comment):
         return False
@@ -81,59 +185,126 @@ def _visible_text(element) -> bool:
     return True
 
 
-def extract_text_and_metadata(html: str, base_url: str) -> SiteContent:
-    soup = BeautifulSoup(html, "html.parser")
+def _add_meta(found: Dict[str, Any], name: str, content: Optional[str]) -> None:
+    if not content:
+        return
+    if name == "description":
+        found["description"] = content
+    elif name == "keywords":
+        found["keywords"] = content
+    elif name.startswith("og:"):
+        found["og"][name] = content
 
-    # Title and meta
-    title = (soup.title.string.strip() if soup.title and soup.title.string else None)
-    description = None
-    keywords = None
-    og: Dict[str, str] = {}
-
-    for m in soup.find_all("meta"):
-        name = (m.get("name") or m.get("property") or "").lower()
-        content = m.get("content")
-        if not content:
-            continue
-        if name == "description":
-            description = content
-        elif name == "keywords":
-            keywords = content
-        elif name.startswith("og:"):
-            og[name] = content
-
-    # Headers and paragraphs
-    texts: List[str] = []
-    for t in soup.find_all(string=True):
-        if isinstance(t, NavigableString) and _visible_text(t):
-            # Collapse whitespace
-            chunk = re.sub(r"\s+", " ", t.strip())
-            if chunk:
-                texts.append(chunk)
 
-    # Links
-    links: List[str] = []
-    for a in soup.find_all("a", href=True):
-        href = a.get("href").strip()
-        abs_url = urljoin(base_url, href)
-        # Filter mailto/tel
-        if abs_url.startswith("mailto:") or abs_url.startswith("tel:"):
-            continue
-        links.append(abs_url)
+def _add_link(links: Dict[str, None], base_url: str, href: str) -> None:
+    abs_url = urljoin(base_url, href.strip())
+    # Only crawlable links; drops mailto:, tel:, javascript: etc.
+    if urlparse(abs_url).scheme not in ("http", "https"):
+        return
+    # Dict keys keep first-seen order and collapse nav/footer repeats
+    links[abs_url] = None
 
-    h1s = [h.get_text(strip=True) for h in soup.find_all("h1")]
-    h2s = [h.get_text(strip=True) for h in soup.find_all("h2")]
 
+def _site_content(
+    base_url: str,
+    title: Optional[str],
+    found: Dict[str, Any],
+    texts: List[str],
+    links: Dict[str, None],
+    h1s: List[str],
+    h2s: List[str],
+) -> SiteContent:
     meta = {
         "title": title,
-        "description": description,
-        "keywords": keywords,
-        "og": og,
+        "description": found["description"],
+        "keywords": found["keywords"],
+        "og": found["og"],
         "h1": h1s,
         "h2": h2s,
     }
+    return SiteContent(url=base_url, text="\n".join(texts), meta=meta, links=list(links))
+
+
+def _extract_with_lexbor(html: str, base_url: str) -> SiteContent:
+    tree = LexborHTMLParser(html)
+    title_node = tree.css_first("title")
+    title = title_node.text().strip() if title_node is not None else None
+    found: Dict[str, Any] = {"description": None, "keywords": None, "og": {}}
+    texts: List[str] = []
+    links: Dict[str, None] = {}
+    h1s: List[str] = []
+    h2s: List[str] = []
+
+    root = tree.root
+    if root is None:
+        return _site_content(base_url, title, found, texts, links, h1s, h2s)
+    # Same single walk as the BeautifulSoup path; comments are "-comment"
+    # nodes and never reach the text branch
+    for node in root.traverse(include_text=True):
+        tag = node.tag
+        if tag == "-text":
+            if node.parent.tag in _HIDDEN_PARENTS:
+                continue
+            # Collapse whitespace
+            chunk = _WS_RE.sub(" ", node.text_content.strip())
+            if chunk:
+                texts.append(chunk)
+        elif tag == "meta":
+            attrs = node.attributes
+            name = (attrs.get("name") or attrs.get("property") or "").lower()
+            _add_meta(found, name, attrs.get("content"))
+        elif tag == "a":
+            attrs = node.attributes
+            if "href" in attrs:
+                _add_link(links, base_url, attrs["href"] or "")
+        elif tag == "h1":
+            h1s.append(node.text(separator="", strip=True))
+        elif tag == "h2":
+            h2s.append(node.text(separator="", strip=True))
+
+    return _site_content(base_url, title or None, found, texts, links, h1s, h2s)
+
+
+def _extract_with_soup(html: str, base_url: str) -> SiteContent:
+    soup = BeautifulSoup(html, _HTML_PARSER)
+
+    # Title and meta
+    title = (soup.title.string.strip() if soup.title and soup.title.string else None)
+    found: Dict[str, Any] = {"description": None, "keywords": None, "og": {}}
+    texts: List[str] = []
+    links: Dict[str, None] = {}
+    h1s: List[str] = []
+    h2s: List[str] = []
+
+    # One walk over the tree instead of a find_all() per element kind
+    for node in soup.descendants:
+        if isinstance(node, NavigableString):
+            if _visible_text(node):
+                # Collapse whitespace
+                chunk = _WS_RE.sub(" ", node.strip())
+                if chunk:
+                    texts.append(chunk)
+            continue
+        tag = node.name
+        if tag == "meta":
+            name = (node.get("name") or node.get("property") or "").lower()
+            _add_meta(found, name, node.get("content"))
+        elif tag == "a":
+            href = node.get("href")
+            if href is not None:
+                _add_link(links, base_url, href)
+        elif tag == "h1":
+            h1s.append(node.get_text(strip=True))
+        elif tag == "h2":
+            h2s.append(node.get_text(strip=True))
+
+    return _site_content(base_url, title, found, texts, links, h1s, h2s)
 
-    return SiteContent(url=base_url, text="\n".join(texts), meta=meta, links=links)
+
+def extract_text_and_metadata(html: str, base_url: str) -> SiteContent:
+    if LexborHTMLParser is not None:
+        return _extract_with_lexbor(html, base_url)
+    return _extract_with_soup(html, base_url)
 
 
 def scrape_site(url: str, max_pages: int = 1, sleep_sec: float = 0.0) -> SiteContent:
@@ -141,6 +312,18 @@ def scrape_site(url: str, max_pages: int = 1, sleep_sec: float = 0.0) -> SiteCon
     For Phase 1 we keep it minimal: just the main page.
     """
     url = normalize_url(url)
+    key = (url, max_pages)
+    cached = _SITE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    content = _scrape_site(url, max_pages, sleep_sec)
+    # Empty results are usually transient (timeouts, robots fetch hiccups)
+    if content.text:
+        _SITE_CACHE.set(key, content)
+    return content
+
+
+def _scrape_site(url: str, max_pages: int, sleep_sec: float) -> SiteContent:
     if not _allowed_by_robots(url):
         return SiteContent(url=url, text="", meta={}, links=[])
 
@@ -152,23 +335,41 @@ def scrape_site(url: str, max_pages: int = 1, sleep_sec: float = 0.0) -> SiteCon
 
     # Optionally, fetch one or two most relevant internal links (heuristic)
     if max_pages > 1 and content.links:
-        internal = [
-            l for l in content.links if urlparse(l).netloc == urlparse(url).netloc
-        ]
+        base_netloc = urlparse(url).netloc
+        # Lazily filtered so only as many links as needed are parsed
+        internal = (l for l in content.links if urlparse(l).netloc == base_netloc)
         seen: set[str] = set([url])
-        texts: List[str] = [content.text]
-        for l in internal[: max_pages - 1]:
+        sub_urls: List[str] = []
+        for l in islice(internal, max_pages - 1):
             if l in seen:
                 continue
             seen.add(l)
             if not _allowed_by_robots(l):
                 continue
-            time.sleep(sleep_sec)
-            sub_html = fetch_url(l)
-            if not sub_html:
-                continue
-            sub = extract_text_and_metadata(sub_html, l)
-            texts.append(sub.text)
-        content.text = "\n".join(texts)
+            sub_urls.append(l)
+
+        # Sub-pages are fetched concurrently; the semaphore keeps at most
+        # _PER_HOST_CONCURRENCY requests in flight against the site.
+        polite = threading.Semaphore(_PER_HOST_CONCURRENCY)
+
+        def _fetch_politely(l: str) -> Optional[str]:
+            with polite:
+                if sleep_sec:
+                    time.sleep(sleep_sec)
+                try:
+                    return fetch_url(l)
+                except (TimeoutError, ConnectionError):
+                    # A slow sub-page should not sink the whole analysis
+                    return None
+
+        texts: List[str] = [content.text]
+        if sub_urls:
+            with ThreadPoolExecutor(max_workers=min(8, len(sub_urls))) as pool:
+                for l, sub_html in zip(sub_urls, pool.map(_fetch_politely, sub_urls)):
+                    if not sub_html:
+                        continue
+                    sub = extract_text_and_metadata(sub_html, l)
+                    texts.append(sub.text)
+        content = content.model_copy(update={"text": "\n".join(texts)})
 
     return content
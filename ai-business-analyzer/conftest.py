@@ -0,0 +1,35 @@
+"""
+Shared pytest fixtures for the test scripts in this directory
+"""
+import os
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+
+import pytest
+
+# Add current directory to path
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
+
+
+def load_app_modules():
+    """Import the app once and hand out the pieces the test scripts use"""
+    from app.analyzer import analyze_text, select_provider
+    from app.models import InsightReport, SiteContent
+    from app.main import app
+
+    return SimpleNamespace(
+        app=app,
+        analyze_text=analyze_text,
+        # The app re-probes providers every 30s; one answer per test run is enough
+        select_provider=lru_cache(maxsize=1)(select_provider),
+        InsightReport=InsightReport,
+        SiteContent=SiteContent,
+    )
+
+
+@pytest.fixture(scope="session")
+def app_modules():
+    return load_app_modules()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Run the offline test scripts side by side and report a combined result
+"""
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# test_all_providers.py is left out: it needs network access to OpenAI/Ollama
+SCRIPTS = (
+    "test_analyzer.py",
+    "test_cloud_simulation.py",
+    "test_complete_pipeline.py",
+    "test_deployment_readiness.py",
+    "test_enhanced_analytics.py",
+    "test_model_fix.py",
+)
+
+
+def run_script(script):
+    """Run one test script in its own interpreter and capture its output"""
+    return subprocess.run(
+        [sys.executable, os.path.join(BASE_DIR, script)],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+
+
+def main():
+    start = time.perf_counter()
+
+    # Each script is already a separate process, so threads are enough to
+    # overlap their interpreter start-up and app imports
+    with ThreadPoolExecutor(max_workers=len(SCRIPTS)) as pool:
+        results = list(pool.map(run_script, SCRIPTS))
+
+    failed = []
+    for script, proc in zip(SCRIPTS, results):
+        print(f"\n{'=' * 20} {script} {'=' * 20}")
+        sys.stdout.write(proc.stdout)
+        if proc.stderr:
+            sys.stderr.write(proc.stderr)
+        if proc.returncode != 0:
+            failed.append(script)
+
+    print(f"\n🧪 Ran {len(SCRIPTS)} scripts in {time.perf_counter() - start:.1f}s")
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}")
+        return 1
+    print("✅ All scripts passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,9 @@ import os
 import sys
 
 # Add the current directory to Python path so 'app' module can be found
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 if __name__ == "__main__":
     import uvicorn
@@ -16,14 +18,35 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
     
+    # Single worker unless the platform says otherwise: os.cpu_count() reports
+    # the host's cores inside containers, and without REDIS_URL each worker
+    # keeps its own rate-limit buckets
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+    # uvloop/httptools ship with uvicorn[standard]; fall back if missing
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
     print(f"🚀 Starting AI Business Analyzer in production mode...")
     print(f"🌐 Server will be available at http://{host}:{port}")
+    print(f"⚙️  Workers: {workers} ({loop}/{http})")
     
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
         reload=False,  # Disable reload in production
+        workers=workers,
+        loop=loop,
+        http=http,
         log_level="info",
-        access_log=True
+        access_log=False  # Per-request log formatting is measurable overhead
     )
\ No newline at end of file
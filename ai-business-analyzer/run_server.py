@@ -9,7 +9,9 @@ import threading
 import time
 
 # Add the current directory to Python path so 'app' module can be found
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 def open_browser():
     """Open the browser after a short delay to ensure server is running"""
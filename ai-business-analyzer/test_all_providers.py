@@ -8,82 +8,92 @@ import sys
 import asyncio
 from dotenv import load_dotenv
 
-# Add the app directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+# Add the current directory to the path so the 'app' package can be found
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
-from analyzer import get_analyzer
-from models import SiteContent
+from app.analyzer import HeuristicProvider, OllamaProvider, OpenAIProvider, analyze_text
 
 # Load environment variables
 load_dotenv()
 
-async def test_provider(provider_name):
+TEST_TEXT = (
+    "Example Business Website. A sample business website for testing. "
+    "This is a test business website with great products and services. "
+    "We focus on customer satisfaction and innovation."
+)
+TEST_META = {"title": "Example Business Website", "keywords": "business, products, services"}
+
+# Providers are passed to analyze_text explicitly, so the checks can run in
+# parallel without flipping a shared environment variable between them
+PROVIDERS = {
+    "heuristic": HeuristicProvider,
+    "openai": OpenAIProvider,
+    "ollama": OllamaProvider,
+}
+
+
+async def check_provider(provider_name):
     """Test a specific analysis provider"""
     print(f"\n🔍 Testing {provider_name.upper()} provider...")
-    
-    # Temporarily set the provider
-    original_provider = os.environ.get('ANALYSIS_PROVIDER')
-    os.environ['ANALYSIS_PROVIDER'] = provider_name
-    
+    provider = PROVIDERS[provider_name]()
+
     try:
-        # Create test data
-        test_content = SiteContent(
-            url="https://example.com",
-            title="Example Business Website",
-            description="A sample business website for testing",
-            content="This is a test business website with great products and services. We focus on customer satisfaction and innovation.",
-            meta={"keywords": "business, products, services"},
-            links=["https://example.com/about", "https://example.com/contact"]
-        )
-        
-        # Get analyzer and test
-        analyzer = get_analyzer()
-        result = await analyzer.analyze(test_content)
-        
+        # analyze_text silently falls back to the heuristic, so make sure the
+        # provider itself answers first
+        if not await asyncio.to_thread(provider.available):
+            print(f"❌ {provider_name.upper()} - Not configured or unreachable")
+            return False
+        if not isinstance(provider, HeuristicProvider):
+            ping = await asyncio.to_thread(provider.generate, "Reply with OK.")
+            if not ping.ok:
+                print(f"❌ {provider_name.upper()} - {ping.text}")
+                return False
+
+        result = await asyncio.to_thread(analyze_text, TEST_TEXT, TEST_META, provider)
+        insights = result.business_insights
+
         print(f"✅ {provider_name.upper()} - Analysis successful!")
-        print(f"   Overall Score: {result.overall_score}/100")
-        print(f"   Business Insights: {len(result.business_insights.strengths)} strengths, {len(result.business_insights.weaknesses)} weaknesses")
-        print(f"   Provider: {result.provider}")
-        
+        print(f"   Overall Score: {result.overall_business_score}/100")
+        if insights:
+            print(f"   Business Insights: {len(insights.competitive_advantages)} advantages, {len(insights.risk_factors)} risks")
+        print(f"   Industry: {result.industry}")
+
         return True
-        
+
     except Exception as e:
         print(f"❌ {provider_name.upper()} - Error: {str(e)}")
         return False
-        
+
     finally:
-        # Restore original provider
-        if original_provider:
-            os.environ['ANALYSIS_PROVIDER'] = original_provider
-        elif 'ANALYSIS_PROVIDER' in os.environ:
-            del os.environ['ANALYSIS_PROVIDER']
+        close = getattr(provider, "close", None)
+        if close:
+            close()
+
 
 async def main():
     """Test all providers"""
     print("🧪 Testing All Analysis Providers")
     print("=" * 50)
-    
-    providers = ['heuristic', 'openai', 'ollama']
-    results = {}
-    
-    for provider in providers:
-        results[provider] = await test_provider(provider)
-    
+
+    # Wall time is the slowest provider rather than the sum of all three
+    async with asyncio.TaskGroup() as tg:
+        tasks = {p: tg.create_task(check_provider(p)) for p in PROVIDERS}
+    results = {p: t.result() for p, t in tasks.items()}
+
     print("\n📊 Test Results Summary")
     print("=" * 30)
     for provider, success in results.items():
         status = "✅ Working" if success else "❌ Failed"
         print(f"{provider.upper():<12}: {status}")
-    
-    print(f"\n💡 Current provider in .env: {os.getenv('ANALYSIS_PROVIDER', 'heuristic')}")
-    
+
     # Recommendations
     working_providers = [p for p, success in results.items() if success]
     if working_providers:
         print(f"\n🎯 Available providers: {', '.join(working_providers)}")
-        print("\n🔄 To switch providers, edit your .env file:")
-        for provider in working_providers:
-            print(f"   ANALYSIS_PROVIDER={provider}")
+        print("\n🔄 The app picks the first available of OpenAI, Ollama, then the heuristic.")
+        print("   Configure OPENAI_API_KEY or OLLAMA_BASE_URL in your .env file to enable them.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -7,7 +7,9 @@ import sys
 import os
 
 # Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 # Temporarily disable environment variables to simulate cloud without AI
 original_openai_key = os.environ.get('OPENAI_API_KEY')
@@ -6,16 +6,14 @@ import sys
 import os
 
 # Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
-from app.analyzer import analyze_text
+SEP = "=" * 50
 
-def test_enhanced_analytics():
-    print("Testing Enhanced Business Analytics...")
-    print("=" * 50)
-    
-    # Test with a comprehensive business description
-    test_text = """
+# Test with a comprehensive business description
+TEST_TEXT = """
     TechFlow Solutions is a leading software development company specializing in 
     enterprise SaaS platforms and mobile applications. We serve Fortune 500 companies 
     and growing businesses with innovative digital transformation solutions.
@@ -31,65 +29,81 @@ def test_enhanced_analytics():
     Features: automation platforms, secure cloud infrastructure, mobile-first design,
     data analytics, AI-powered recommendations, and seamless third-party integrations.
     """
+
+TEST_META = {
+    "title": "TechFlow Solutions - Enterprise Software Development",
+    "description": "Leading SaaS development company serving Fortune 500 clients",
+    "og": {
+        "og:title": "TechFlow Solutions",
+        "og:description": "Enterprise software development experts"
+    },
+    "h1": ["Welcome to TechFlow", "Our Services", "Why Choose Us"],
+    "h2": ["Software Development", "Cloud Solutions", "Customer Success"]
+}
+
+
+def test_enhanced_analytics(app_modules):
+    analyze_text = app_modules.analyze_text
+    print("Testing Enhanced Business Analytics...")
+    print(SEP)
     
-    test_meta = {
-        "title": "TechFlow Solutions - Enterprise Software Development",
-        "description": "Leading SaaS development company serving Fortune 500 clients",
-        "og": {
-            "og:title": "TechFlow Solutions",
-            "og:description": "Enterprise software development experts"
-        },
-        "h1": ["Welcome to TechFlow", "Our Services", "Why Choose Us"],
-        "h2": ["Software Development", "Cloud Solutions", "Customer Success"]
-    }
-    
+    # Warm-up: pay one-time setup (cue tables, compiled regexes, provider
+    # clients, and ~0.3s loading the Numba-compiled score kernel when numba
+    # is installed) before the analysis under test
+    analyze_text("Warm-up call for the business analyzer", {})
+
     # Analyze with enhanced business insights
-    result = analyze_text(test_text, test_meta)
+    result = analyze_text(TEST_TEXT, TEST_META)
     
-    print(f"📊 BUSINESS OVERVIEW")
-    print(f"Industry: {result.industry}")
-    print(f"Target Audience: {result.target_audience}")
-    print(f"Overall Business Score: {result.overall_business_score}/100")
-    print(f"Growth Readiness: {result.readiness_for_growth}")
-    print()
+    # Collected and written once instead of a print() per line
+    out = []
+    out.append(f"📊 BUSINESS OVERVIEW")
+    out.append(f"Industry: {result.industry}")
+    out.append(f"Target Audience: {result.target_audience}")
+    out.append(f"Overall Business Score: {result.overall_business_score}/100")
+    out.append(f"Growth Readiness: {result.readiness_for_growth}")
+    out.append("")
     
     if result.business_insights:
-        print(f"💼 BUSINESS INSIGHTS")
-        print(f"Market Positioning: {result.business_insights.market_positioning}")
-        print(f"Digital Maturity Score: {result.business_insights.digital_maturity_score}/10")
-        print(f"Revenue Streams: {result.business_insights.revenue_streams}")
-        print(f"Competitive Advantages: {result.business_insights.competitive_advantages}")
-        print()
+        out.append(f"💼 BUSINESS INSIGHTS")
+        out.append(f"Market Positioning: {result.business_insights.market_positioning}")
+        out.append(f"Digital Maturity Score: {result.business_insights.digital_maturity_score}/10")
+        out.append(f"Revenue Streams: {result.business_insights.revenue_streams}")
+        out.append(f"Competitive Advantages: {result.business_insights.competitive_advantages}")
+        out.append("")
     
     if result.marketing_analytics:
-        print(f"📈 MARKETING ANALYTICS")
-        print(f"Brand Presence Score: {result.marketing_analytics.brand_presence_score}/10")
-        print(f"Content Quality Score: {result.marketing_analytics.content_quality_score}/10")
-        print(f"UX Score: {result.marketing_analytics.user_experience_score}/10")
-        print(f"Social Proof: {result.marketing_analytics.social_proof_indicators}")
-        print()
+        out.append(f"📈 MARKETING ANALYTICS")
+        out.append(f"Brand Presence Score: {result.marketing_analytics.brand_presence_score}/10")
+        out.append(f"Content Quality Score: {result.marketing_analytics.content_quality_score}/10")
+        out.append(f"UX Score: {result.marketing_analytics.user_experience_score}/10")
+        out.append(f"Social Proof: {result.marketing_analytics.social_proof_indicators}")
+        out.append("")
     
     if result.technical_analytics:
-        print(f"⚙️ TECHNICAL ANALYTICS")
-        print(f"Website Performance: {result.technical_analytics.website_performance_score}/10")
-        print(f"Mobile Optimization: {result.technical_analytics.mobile_optimization}")
-        print(f"Security Indicators: {result.technical_analytics.security_indicators}")
-        print()
+        out.append(f"⚙️ TECHNICAL ANALYTICS")
+        out.append(f"Website Performance: {result.technical_analytics.website_performance_score}/10")
+        out.append(f"Mobile Optimization: {result.technical_analytics.mobile_optimization}")
+        out.append(f"Security Indicators: {result.technical_analytics.security_indicators}")
+        out.append("")
     
-    print(f"🎯 STRATEGIC RECOMMENDATIONS")
-    print(f"Strategic Priorities: {result.strategic_priorities}")
-    print(f"Quick Wins: {result.quick_wins}")
-    print(f"Investment Recommendations: {result.investment_recommendations}")
-    print()
+    out.append(f"🎯 STRATEGIC RECOMMENDATIONS")
+    out.append(f"Strategic Priorities: {result.strategic_priorities}")
+    out.append(f"Quick Wins: {result.quick_wins}")
+    out.append(f"Investment Recommendations: {result.investment_recommendations}")
+    out.append("")
     
-    print(f"🚀 DIGITAL TRANSFORMATION")
-    print(f"Transformation Needs: {result.digital_transformation_needs}")
+    out.append(f"🚀 DIGITAL TRANSFORMATION")
+    out.append(f"Transformation Needs: {result.digital_transformation_needs}")
+    sys.stdout.write("\n".join(out) + "\n")
     
     return True
 
 if __name__ == "__main__":
+    from conftest import load_app_modules
+
     try:
-        test_enhanced_analytics()
+        test_enhanced_analytics(load_app_modules())
         print("\n✅ Enhanced business analytics test completed successfully!")
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
@@ -6,43 +6,49 @@ import sys
 import os
 
 # Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
-from app.models import SiteContent
+# This is the type of data structure that caused the error
+TEST_META = {
+    "title": "Example Website",
+    "description": "A test website description",
+    "keywords": "test, example, website",
+    "og": {
+        "og:locale": "en_US",
+        "og:title": "Example Site",
+        "og:description": "Test description",
+        "og:type": "website",
+        "og:image": "https://example.com/image.jpg",
+        "og:image:type": "image/jpeg"
+    },
+    "h1": ["Main Heading", "Secondary Heading"],
+    "h2": ["Subheading 1", "Subheading 2"]
+}
+TEST_TEXT = "Sample website content text here"
 
-def test_site_content_model():
+
+def test_site_content_model(app_modules):
+    SiteContent = app_modules.SiteContent
     print("Testing SiteContent model with og metadata...")
     
-    # This is the type of data structure that caused the error
-    test_meta = {
-        "title": "Example Website",
-        "description": "A test website description",
-        "keywords": "test, example, website",
-        "og": {
-            "og:locale": "en_US",
-            "og:title": "Example Site",
-            "og:description": "Test description",
-            "og:type": "website",
-            "og:image": "https://example.com/image.jpg",
-            "og:image:type": "image/jpeg"
-        },
-        "h1": ["Main Heading", "Secondary Heading"],
-        "h2": ["Subheading 1", "Subheading 2"]
-    }
-    
     try:
+        data = {
+            "url": "https://example.com",
+            "text": TEST_TEXT,
+            "meta": TEST_META,
+            "links": ["https://example.com/about", "https://example.com/contact"]
+        }
         # This should now work without validation errors
-        content = SiteContent(
-            url="https://example.com",
-            text="Sample website content text here",
-            meta=test_meta,
-            links=["https://example.com/about", "https://example.com/contact"]
-        )
+        SiteContent.model_validate(data)
+        # Known-good from here on, so build the inspected instance unvalidated
+        content = SiteContent.model_construct(**data)
         
         print("✅ SiteContent model validation successful!")
         print(f"   URL: {content.url}")
         print(f"   Text length: {len(content.text)} chars")
-        print(f"   Meta keys: {list(content.meta.keys())}")
+        print(f"   Meta keys: {', '.join(content.meta)}")
         print(f"   OG data type: {type(content.meta['og'])}")
         print(f"   Links count: {len(content.links)}")
         return True
@@ -52,7 +58,9 @@ def test_site_content_model():
         return False
 
 if __name__ == "__main__":
-    success = test_site_content_model()
+    from conftest import load_app_modules
+
+    success = test_site_content_model(load_app_modules())
     if success:
         print("\n🎉 Model fix verified successfully!")
     else: